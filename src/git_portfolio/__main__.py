@@ -3,6 +3,7 @@ import functools
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Optional
 from typing import Tuple
 from typing import TypeVar
 from typing import Union
@@ -46,9 +47,21 @@ def gitp_config_check(func: F) -> F:
 
 
 @click.group("cli")
-def main() -> None:
+@click.option(
+    "--max-concurrent",
+    type=click.IntRange(min=1),
+    help="Maximum number of concurrent requests to GitHub.",
+)
+@click.pass_context
+def main(ctx: click.Context, max_concurrent: Optional[int]) -> None:
     """Git Portfolio."""
-    pass
+    # kept in context only, so it is not saved in config
+    ctx.obj = {"max_concurrent": max_concurrent}
+
+
+def _get_max_concurrent() -> int:
+    obj = click.get_current_context().obj or {}
+    return int(obj.get("max_concurrent") or 0)
 
 
 def _echo_outputs(response: Union[res.ResponseFailure, res.ResponseSuccess]) -> None:
@@ -219,7 +232,9 @@ def create_issues() -> Union[res.ResponseFailure, res.ResponseSuccess]:
     issue = p.InquirerPrompter.create_issues(
         CONFIG_MANAGER.config.github_selected_repos
     )
-    return ghci.GhCreateIssueUseCase(CONFIG_MANAGER, github_service).execute(issue)
+    return ghci.GhCreateIssueUseCase(
+        CONFIG_MANAGER, github_service, _get_max_concurrent()
+    ).execute(issue)
 
 
 @create.command("prs")
@@ -230,7 +245,9 @@ def create_prs() -> Union[res.ResponseFailure, res.ResponseSuccess]:
     pr = p.InquirerPrompter.create_pull_requests(
         CONFIG_MANAGER.config.github_selected_repos
     )
-    return ghcp.GhCreatePrUseCase(CONFIG_MANAGER, github_service).execute(pr)
+    return ghcp.GhCreatePrUseCase(
+        CONFIG_MANAGER, github_service, _get_max_concurrent()
+    ).execute(pr)
 
 
 @merge.command("prs")
@@ -242,7 +259,9 @@ def merge_prs() -> Union[res.ResponseFailure, res.ResponseSuccess]:
         github_service.get_username(),
         CONFIG_MANAGER.config.github_selected_repos,
     )
-    return ghmp.GhMergePrUseCase(CONFIG_MANAGER, github_service).execute(pr_merge)
+    return ghmp.GhMergePrUseCase(
+        CONFIG_MANAGER, github_service, _get_max_concurrent()
+    ).execute(pr_merge)
 
 
 @delete.command("branches")
@@ -253,7 +272,9 @@ def delete_branches() -> Union[res.ResponseFailure, res.ResponseSuccess]:
     branch = p.InquirerPrompter.delete_branches(
         CONFIG_MANAGER.config.github_selected_repos
     )
-    return ghdb.GhDeleteBranchUseCase(CONFIG_MANAGER, github_service).execute(branch)
+    return ghdb.GhDeleteBranchUseCase(
+        CONFIG_MANAGER, github_service, _get_max_concurrent()
+    ).execute(branch)
 
 
 main.add_command(configure)
@@ -1,34 +1,65 @@
 """Configuration manager module."""
+import copy
+import functools
 import os
 import pathlib
+from typing import Any
+from typing import Optional
 
 import yaml
 
 import git_portfolio.domain.config as c
 
 
+@functools.lru_cache(maxsize=1)
+def _read_config_file(config_path: str, mtime: float) -> Any:
+    """Read YAML config data, cached until the file is modified."""
+    with open(config_path) as config_file:
+        return yaml.safe_load(config_file)
+
+
 class ConfigManager:
     """Configuration manager class."""
 
     def __init__(self, config_filename: str = "config.yaml") -> None:
-        """Load config if it exists."""
+        """Set config path, config is only loaded when first used."""
         self.config_folder = os.path.join(os.path.expanduser("~"), ".gitp")
         self.config_path = os.path.join(self.config_folder, config_filename)
+        self._config: Optional[c.Config] = None
+
+    @property
+    def config(self) -> c.Config:
+        """Config property, loads config if it exists.
+
+        Returns:
+            c.Config: current config.
+        """
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+
+    @config.setter
+    def config(self, config: c.Config) -> None:
+        self._config = config
 
+    def _load_config(self) -> c.Config:
         if os.path.exists(self.config_path):
             print("Loading previous config...\n")
-            with open(self.config_path, "r+") as config_file:
-                try:
-                    data = yaml.safe_load(config_file)
-                    if data:
-                        try:
-                            self.config = c.Config(**data)
-                            return
-                        except TypeError:
-                            config_file.truncate(0)
-                except yaml.scanner.ScannerError:
+            mtime = os.path.getmtime(self.config_path)
+            try:
+                data = _read_config_file(self.config_path, mtime)
+                if data:
+                    # cached data is shared, config gets its own copy
+                    config = c.Config(**copy.deepcopy(data))
+                    # repos selected twice would be processed twice
+                    config.github_selected_repos = list(
+                        dict.fromkeys(config.github_selected_repos or [])
+                    )
+                    return config
+            except (yaml.scanner.ScannerError, TypeError):
+                with open(self.config_path, "r+") as config_file:
                     config_file.truncate(0)
-        self.config = c.Config("", "", [])
+        return c.Config("", "", [])
 
     def config_is_empty(self) -> bool:
         """Check if config is empty."""
@@ -43,5 +74,6 @@ class ConfigManager:
             config_dict = vars(self.config)
             with open(self.config_path, "w") as config_file:
                 yaml.dump(config_dict, config_file)
+            _read_config_file.cache_clear()
         else:
             raise AttributeError
@@ -10,3 +10,4 @@ class Config:
     github_hostname: str
     github_access_token: str
     github_selected_repos: List[str]
+    max_workers: int = 0
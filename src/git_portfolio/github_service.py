@@ -1,14 +1,28 @@
 """Github service module."""
 from typing import Any
+from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Union
 
 import github3
+import urllib3.util.retry
 
 import git_portfolio.domain.gh_connection_settings as cs
 import git_portfolio.domain.issue as i
 import git_portfolio.domain.pull_request as pr
 import git_portfolio.domain.pull_request_merge as prm
+import git_portfolio.rate_limit as rl
+
+# enough pooled connections so concurrent calls reuse them instead of reconnecting
+POOL_MAXSIZE = 32
+# retry idempotent requests failing with transient server errors
+RETRY = urllib3.util.retry.Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
+)
 
 
 class GithubService:
@@ -17,8 +31,15 @@ class GithubService:
     def __init__(self, github_config: cs.GhConnectionSettings) -> None:
         """Constructor."""
         self.connection = self._get_connection(github_config)
-        self.user = self._test_connection(self.connection)
-        self.repos = self.connection.repositories()
+        # repos are fetched once, indexed by name and safely shared between threads,
+        # listing them also tests the connection
+        try:
+            self.repos = self._get_repos()
+        except github3.exceptions.AuthenticationFailed:
+            raise AttributeError()
+        except github3.exceptions.ConnectionError:
+            raise ConnectionError()
+        self._user: Optional[github3.users.AuthenticatedUser] = None
 
     def _get_connection(
         self, github_config: cs.GhConnectionSettings
@@ -33,29 +54,37 @@ class GithubService:
         # GitHub.com
         else:
             self.connection = github3.login(token=github_config.access_token)
+        adapter = rl.RateLimitAdapter(
+            pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY
+        )
+        self.connection.session.mount("https://", adapter)
         return self.connection
 
-    @staticmethod
-    def _test_connection(
-        connection: Union[github3.GitHub, github3.GitHubEnterprise]
-    ) -> github3.users.AuthenticatedUser:
-        """Test connection by returning user."""
-        try:
-            return connection.me()
-        except github3.exceptions.AuthenticationFailed:
-            raise AttributeError()
-        except github3.exceptions.ConnectionError:
-            raise ConnectionError()
+    def _get_repos(self) -> Dict[str, github3.repos.ShortRepository]:
+        """Get repositories by name."""
+        # github3 follows next page links, requesting only the pages that exist
+        return {repo.full_name: repo for repo in self.connection.repositories()}
 
     def _get_repo(self, repo_name: str) -> github3.repos.ShortRepository:
-        for repo in self.repos:
-            if repo.full_name == repo_name:
-                return repo
-        raise NameError(f"Repository {repo_name} not found.")
+        try:
+            return self.repos[repo_name]
+        except KeyError:
+            raise NameError(f"Repository {repo_name} not found.")
 
     def get_repo_names(self) -> List[str]:
         """Get list of repository names."""
-        return [repo.full_name for repo in self.repos]
+        return list(self.repos)
+
+    @property
+    def user(self) -> github3.users.AuthenticatedUser:
+        """Authenticated user, only requested when first used.
+
+        Returns:
+            github3.users.AuthenticatedUser: authenticated user.
+        """
+        if self._user is None:
+            self._user = self.connection.me()
+        return self._user
 
     def get_username(self) -> Any:
         """Get Github username."""
@@ -70,8 +99,10 @@ class GithubService:
             )
             return f"{github_repo}: issue created successfully."
         except github3.exceptions.ClientError as github_exception:
-            if github_exception.msg == "Issues are disabled for this repo":
-                return f"{github_repo}: {github_exception.msg}. It may be a fork."
+            # GitHub answers 410 Gone when issues are disabled
+            if github_exception.code == 410:
+                msg = github_exception.msg or "Issues are disabled for this repo"
+                return f"{github_repo}: {msg}. It may be a fork."
             else:
                 return f"{github_repo}: {github_exception.msg}."
 
@@ -105,27 +136,30 @@ class GithubService:
                 issue.add_labels(*pr.labels)
             return f"{github_repo}: PR created successfully."
         except github3.exceptions.UnprocessableEntity as github_exception:
-            extra = ""
+            extra = []
             for error in github_exception.errors:
                 if "message" in error:
-                    extra += f" {error['message']}."
+                    extra.append(f"{error['message']}.")
                 else:
-                    extra += f" Invalid field {error['field']}."
-            return f"{github_repo}: {github_exception.msg}.{extra}"
+                    extra.append(f"Invalid field {error['field']}.")
+            return " ".join([f"{github_repo}: {github_exception.msg}.", *extra])
 
     def link_issues(self, github_repo: str, pr: pr.PullRequest) -> None:
         """Set body message and labels on PR."""
+        # a new set keeps the labels of the request untouched
+        labels = set(pr.labels)
         repo = self._get_repo(github_repo)
-        labels = pr.labels
         issues = repo.issues(state="open")
-        closes = ""
+        closes = []
         for issue in issues:
             if pr.link in issue.title:
-                closes += f"Closes #{issue.number}\n"
-                issue_labels = [label.name for label in issue.labels()]
+                closes.append(f"Closes #{issue.number}")
+                # labels come with the issue listing, no need to request them
+                issue_labels = [label.name for label in issue.original_labels]
                 labels.update(issue_labels)
         if closes:
-            pr.body += f"\n\n{closes}"
+            closes_text = "\n".join(closes)
+            pr.body += f"\n\n{closes_text}\n"
         pr.labels = labels
 
     def delete_branch_from_repo(self, github_repo: str, branch: str) -> str:
@@ -148,7 +182,8 @@ class GithubService:
         # https://developer.github.com/v3/pulls/#list-pull-requests
         # head needs format "user/org:branch"
         head = f"{pr_merge.prefix}:{pr_merge.head}"
-        pulls = list(repo.pull_requests(base=pr_merge.base, head=head))
+        # two results are enough to tell if the PR is unique, one request only
+        pulls = list(repo.pull_requests(base=pr_merge.base, head=head, number=2))
         if not pulls:
             return (
                 f"{github_repo}: no open PR found for {pr_merge.base}:{pr_merge.head}."
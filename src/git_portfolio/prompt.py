@@ -1,4 +1,5 @@
 """User prompting module."""
+import re
 from typing import Any
 from typing import List
 
@@ -10,6 +11,9 @@ import git_portfolio.domain.pull_request as pr
 import git_portfolio.domain.pull_request_merge as prm
 import git_portfolio.prompt_validation as val
 
+# comma with surrounding spaces, splitting also trims labels
+LABEL_SEPARATOR = re.compile(r"\s*,\s*")
+
 
 class InquirerPrompter:
     """Question prompting using inquirer."""
@@ -93,7 +97,7 @@ class InquirerPrompter:
             correct = answers["correct"]
 
         labels = (
-            set(label.strip() for label in answers["labels"].split(","))
+            set(LABEL_SEPARATOR.split(answers["labels"].strip()))
             if answers["labels"]
             else set()
         )
@@ -157,7 +161,7 @@ class InquirerPrompter:
             correct = answers["correct"]
 
         labels = (
-            set(label.strip() for label in answers["labels"].split(","))
+            set(LABEL_SEPARATOR.split(answers["labels"].strip()))
             if answers["labels"]
             else set()
         )
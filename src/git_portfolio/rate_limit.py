@@ -0,0 +1,84 @@
+"""GitHub rate limit handling module."""
+import math
+import random
+import threading
+import time
+from typing import Any
+from typing import Optional
+
+import click
+import requests.adapters
+
+# remaining requests under which calls wait for the rate limit reset
+REMAINING_THRESHOLD = 50
+# seconds to wait between retries when a secondary rate limit is hit
+BACKOFF_DELAYS = (1, 2, 4, 8)
+
+
+class RateLimitAdapter(requests.adapters.HTTPAdapter):
+    """HTTP adapter that throttles requests according to GitHub rate limits."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Constructor."""
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self._remaining: Optional[int] = None
+        self._reset_ts = 0.0
+        # reset timestamp the wait was last announced for, once for all threads
+        self._notified_reset_ts = 0.0
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """Send request waiting for rate limits."""
+        delays = iter(BACKOFF_DELAYS)
+        while True:
+            self._wait_for_reset()
+            response = super().send(request, **kwargs)
+            self._update_limits(response)
+            delay = next(delays, None)
+            if delay is None or not self._is_rate_limited(response):
+                return response
+            # primary rate limit: next iteration waits for the reset
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                continue
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                time.sleep(float(retry_after))
+            else:
+                time.sleep(delay + random.uniform(0, delay))  # noqa: S311
+
+    def _wait_for_reset(self) -> None:
+        with self._lock:
+            if self._remaining is None or self._remaining >= REMAINING_THRESHOLD:
+                return
+            wait = self._reset_ts - time.time()
+            notify = wait > 0 and self._notified_reset_ts != self._reset_ts
+            if notify:
+                self._notified_reset_ts = self._reset_ts
+        if notify:
+            click.echo(
+                f"GitHub rate limit almost reached, waiting {math.ceil(wait)}s "
+                "for it to reset.",
+                err=True,
+            )
+        if wait > 0:
+            time.sleep(wait)
+
+    def _update_limits(self, response: requests.Response) -> None:
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        with self._lock:
+            self._remaining = int(remaining)
+            self._reset_ts = float(reset)
+
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        if response.status_code not in (403, 429):
+            return False
+        return (
+            response.headers.get("X-RateLimit-Remaining") == "0"
+            or "secondary rate limit" in response.text.lower()
+        )
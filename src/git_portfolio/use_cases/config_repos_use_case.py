@@ -17,6 +17,8 @@ class ConfigReposUseCase:
         self, selected_repos: List[str]
     ) -> Union[res.ResponseFailure, res.ResponseSuccess]:
         """Configuration of git repositories."""
-        self.config_manager.config.github_selected_repos = selected_repos
+        self.config_manager.config.github_selected_repos = list(
+            dict.fromkeys(selected_repos)
+        )
         self.config_manager.save_config()
         return res.ResponseSuccess("gitp repositories successfully configured.")
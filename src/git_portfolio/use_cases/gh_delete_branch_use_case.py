@@ -1,21 +1,13 @@
 """Delete branch on Github use case."""
 from typing import Union
 
-import git_portfolio.config_manager as cm
-import git_portfolio.github_service as ghs
 import git_portfolio.response_objects as res
+import git_portfolio.use_cases.gh_use_case as ghu
 
 
-class GhDeleteBranchUseCase:
+class GhDeleteBranchUseCase(ghu.GhUseCase):
     """Github delete branch use case."""
 
-    def __init__(
-        self, config_manager: cm.ConfigManager, github_service: ghs.GithubService
-    ) -> None:
-        """Initializer."""
-        self.config_manager = config_manager
-        self.github_service = github_service
-
     def execute(
         self, branch: str, github_repo: str = ""
     ) -> Union[res.ResponseFailure, res.ResponseSuccess]:
@@ -23,9 +15,9 @@ class GhDeleteBranchUseCase:
         if github_repo:
             output = self.github_service.delete_branch_from_repo(github_repo, branch)
         else:
-            output = ""
-            for github_repo in self.config_manager.config.github_selected_repos:
-                output += self.github_service.delete_branch_from_repo(
+            output = self.call_for_all_repos(
+                lambda github_repo: self.github_service.delete_branch_from_repo(
                     github_repo, branch
                 )
+            )
         return res.ResponseSuccess(output)
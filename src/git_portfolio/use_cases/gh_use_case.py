@@ -0,0 +1,58 @@
+"""Base Github use case."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import git_portfolio.config_manager as cm
+import git_portfolio.github_service as ghs
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+
+class GhUseCase:
+    """Github use case base class."""
+
+    def __init__(
+        self,
+        config_manager: cm.ConfigManager,
+        github_service: ghs.GithubService,
+        max_workers: int = 0,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            config_manager: configuration manager.
+            github_service: Github service.
+            max_workers: number of workers overriding the configured one for this
+                use case only, it is never saved in config.
+        """
+        self.config_manager = config_manager
+        self.github_service = github_service
+        self.max_workers = max_workers
+
+    def call_for_all_repos(self, repo_call: Callable[[str], str]) -> str:
+        """Run `repo_call` for every selected repo using a thread pool.
+
+        Calls are independent and I/O bound, so they run concurrently. Outputs are
+        concatenated in the same order as the selected repos.
+
+        Args:
+            repo_call: function receiving a repo name and returning its output.
+
+        Returns:
+            str: concatenated output.
+        """
+        max_workers = self.max_workers or self._get_configured_max_workers()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outputs = executor.map(
+                repo_call, self.config_manager.config.github_selected_repos
+            )
+            return "".join(outputs)
+
+    def _get_configured_max_workers(self) -> int:
+        """Get number of workers from config, default when not a positive int."""
+        max_workers = self.config_manager.config.max_workers
+        # config file is edited by hand, so it may hold any value
+        if type(max_workers) is int and max_workers > 0:
+            return max_workers
+        return DEFAULT_MAX_WORKERS
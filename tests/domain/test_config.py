@@ -12,3 +12,4 @@ def test_config_model_init() -> None:
     assert test_config.github_hostname == github_hostname
     assert test_config.github_access_token == github_access_token
     assert test_config.github_selected_repos == github_selected_repos
+    assert test_config.max_workers == 0
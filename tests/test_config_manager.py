@@ -1,8 +1,11 @@
 """Test cases for the config manager module."""
+import os
+
 import pytest
 from _pytest.tmpdir import Path
 from pytest_mock import MockerFixture
 
+import git_portfolio.domain.config as c
 from git_portfolio import config_manager as cm
 
 
@@ -25,7 +28,7 @@ def test_init_invalid_config(tmp_path: Path, mock_os_join_path: MockerFixture) -
     p = d / filename
     p.write_text("in:valid")
     mock_os_join_path.side_effect = [str(d), str(p)]
-    cm.ConfigManager()
+    cm.ConfigManager().config
     # os_truncate.assert_called_once_with(0)
 
 
@@ -42,10 +45,39 @@ def test_save_invalid_yaml(tmp_path: Path, mock_os_join_path: MockerFixture) ->
     p = d / filename
     p.write_text(content)
     mock_os_join_path.side_effect = [str(d), str(p)]
-    cm.ConfigManager()
+    cm.ConfigManager().config
     # os_truncate.assert_called_once_with(0)
 
 
+def test_init_does_not_load(tmp_path: Path, mock_os_join_path: MockerFixture) -> None:
+    """It only loads config file on first use."""
+    filename = "config.yaml"
+    content = (
+        "github_access_token: aaaaabbbbbccccc12345\n"
+        "github_hostname: ''\n"
+        "github_selected_repos:\n"
+        " - staticdev/test\n"
+    )
+    d = tmp_path
+    p = d / filename
+    mock_os_join_path.side_effect = [str(d), str(p)]
+    manager = cm.ConfigManager()
+    p.write_text(content)
+
+    assert manager.config.github_selected_repos == ["staticdev/test"]
+
+
+def test_set_config(tmp_path: Path, mock_os_join_path: MockerFixture) -> None:
+    """It uses the set config without loading the file."""
+    d = tmp_path
+    mock_os_join_path.side_effect = [str(d), str(d / "config.yaml")]
+    manager = cm.ConfigManager()
+    config = c.Config("", "mytoken", ["staticdev/omg"])
+    manager.config = config
+
+    assert manager.config is config
+
+
 def test_save_config_no_file(tmp_path: Path, mock_os_join_path: MockerFixture) -> None:
     """It raises AttributeError."""
     d = tmp_path
@@ -89,3 +121,74 @@ def test_save_config_success(
     manager = cm.ConfigManager()
     manager.save_config()
     mock_yaml_dump.assert_called_once()
+
+
+def test_load_config_cached(
+    mocker: MockerFixture, tmp_path: Path, mock_os_join_path: MockerFixture
+) -> None:
+    """It parses an unchanged config file only once."""
+    filename = "config3.yaml"
+    content = (
+        "github_access_token: aaaaabbbbbccccc12345\n"
+        "github_hostname: ''\n"
+        "github_selected_repos:\n"
+        " - staticdev/test\n"
+    )
+    d = tmp_path
+    p = d / filename
+    p.write_text(content)
+    mock_os_join_path.side_effect = [str(d), str(p), str(d), str(p)]
+    safe_load = mocker.spy(cm.yaml, "safe_load")
+    first = cm.ConfigManager(filename)
+    first.config.github_selected_repos.append("staticdev/omg")
+    second = cm.ConfigManager(filename)
+
+    assert second.config.github_selected_repos == ["staticdev/test"]
+    safe_load.assert_called_once()
+
+
+def test_save_config_clears_cache(
+    tmp_path: Path, mock_os_join_path: MockerFixture
+) -> None:
+    """It reads the saved config on next load, even with same modification time."""
+    filename = "config4.yaml"
+    content = (
+        "github_access_token: aaaaabbbbbccccc12345\n"
+        "github_hostname: ''\n"
+        "github_selected_repos:\n"
+        " - staticdev/test\n"
+    )
+    d = tmp_path
+    p = d / filename
+    p.write_text(content)
+    mock_os_join_path.side_effect = [str(d), str(p), str(d), str(p)]
+    first = cm.ConfigManager(filename)
+    first.config.github_selected_repos = ["staticdev/omg"]
+    stat = p.stat()
+    first.save_config()
+    os.utime(p, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    second = cm.ConfigManager(filename)
+
+    assert second.config.github_selected_repos == ["staticdev/omg"]
+
+
+def test_load_config_duplicated_repos(
+    tmp_path: Path, mock_os_join_path: MockerFixture
+) -> None:
+    """It removes duplicated repos keeping their order."""
+    filename = "config5.yaml"
+    content = (
+        "github_access_token: aaaaabbbbbccccc12345\n"
+        "github_hostname: ''\n"
+        "github_selected_repos:\n"
+        " - staticdev/test\n"
+        " - staticdev/omg\n"
+        " - staticdev/test\n"
+    )
+    d = tmp_path
+    p = d / filename
+    p.write_text(content)
+    mock_os_join_path.side_effect = [str(d), str(p)]
+    manager = cm.ConfigManager(filename)
+
+    assert manager.config.github_selected_repos == ["staticdev/test", "staticdev/omg"]
@@ -11,6 +11,7 @@ import git_portfolio.domain.issue as i
 import git_portfolio.domain.pull_request as pr
 import git_portfolio.domain.pull_request_merge as mpr
 import git_portfolio.github_service as gc
+import git_portfolio.rate_limit as rl
 
 
 @pytest.fixture
@@ -115,13 +116,29 @@ def test_init_github_entreprise(
     gc.GithubService(domain_gh_conn_settings[1])
 
 
+def test_init_shares_connection_pool(
+    domain_gh_conn_settings: List[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+) -> None:
+    """It mounts a pooled rate limit adapter sized for concurrent calls."""
+    gc.GithubService(domain_gh_conn_settings[0])
+    mount = mock_github3_login.return_value.session.mount
+    mount.assert_called_once()
+    prefix, adapter = mount.call_args[0]
+
+    assert prefix == "https://"
+    assert isinstance(adapter, rl.RateLimitAdapter)
+    assert adapter._pool_maxsize == gc.POOL_MAXSIZE
+    assert adapter.max_retries.status_forcelist == (502, 503, 504)
+
+
 def test_init_wrong_token(
     mocker: MockerFixture,
     domain_gh_conn_settings: List[cs.GhConnectionSettings],
     mock_github3_login: MockerFixture,
 ) -> None:
     """It succeeds."""
-    mock_github3_login.return_value.me.side_effect = (
+    mock_github3_login.return_value.repositories.side_effect = (
         github3.exceptions.AuthenticationFailed(mocker.Mock())
     )
     with pytest.raises(AttributeError):
@@ -134,8 +151,8 @@ def test_init_connection_error(
     mock_github3_login: MockerFixture,
 ) -> None:
     """It succeeds."""
-    mock_github3_login.return_value.me.side_effect = github3.exceptions.ConnectionError(
-        mocker.Mock()
+    mock_github3_login.return_value.repositories.side_effect = (
+        github3.exceptions.ConnectionError(mocker.Mock())
     )
     with pytest.raises(ConnectionError):
         gc.GithubService(domain_gh_conn_settings[0])
@@ -161,6 +178,7 @@ def test_get_repo_names(
     result = gc.GithubService(domain_gh_conn_settings[0]).get_repo_names()
 
     assert result == expected
+    mock_github3_login.return_value.repositories.assert_called_once_with()
 
 
 def test_get_username(
@@ -170,9 +188,13 @@ def test_get_username(
     """It returns user name."""
     expected = "staticdev"
     mock_github3_login.return_value.me.return_value.login = "staticdev"
-    result = gc.GithubService(domain_gh_conn_settings[0]).get_username()
+    github_service = gc.GithubService(domain_gh_conn_settings[0])
+    mock_github3_login.return_value.me.assert_not_called()
+    result = github_service.get_username()
+    github_service.get_username()
 
     assert result == expected
+    mock_github3_login.return_value.me.assert_called_once()
 
 
 def test_create_issue_from_repo_success(
@@ -195,7 +217,7 @@ def test_create_issue_from_repo_fork(
     domain_issue: i.Issue,
 ) -> None:
     """It gives a message error telling it is a fork."""
-    exception_mock = mocker.Mock()
+    exception_mock = mocker.Mock(status_code=410)
     exception_mock.json.return_value.get.return_value = (
         "Issues are disabled for this repo"
     )
@@ -211,6 +233,27 @@ def test_create_issue_from_repo_fork(
     )
 
 
+def test_create_issue_from_repo_fork_no_message(
+    mocker: MockerFixture,
+    domain_gh_conn_settings: List[cs.GhConnectionSettings],
+    mock_github3_login: MockerFixture,
+    domain_issue: i.Issue,
+) -> None:
+    """It gives a default message error telling it is a fork."""
+    exception_mock = mocker.Mock(status_code=410)
+    exception_mock.json.return_value.get.return_value = None
+    repo = mock_github3_login.return_value.repositories.return_value[1]
+    repo.create_issue.side_effect = github3.exceptions.ClientError(exception_mock)
+    response = gc.GithubService(domain_gh_conn_settings[0]).create_issue_from_repo(
+        "staticdev/omg", domain_issue
+    )
+
+    assert (
+        response
+        == "staticdev/omg: Issues are disabled for this repo. It may be a fork."
+    )
+
+
 def test_create_issue_from_repo_other_error(
     mocker: MockerFixture,
     domain_gh_conn_settings: List[cs.GhConnectionSettings],
@@ -218,7 +261,7 @@ def test_create_issue_from_repo_other_error(
     domain_issue: i.Issue,
 ) -> None:
     """It gives the message error returned from the API."""
-    exception_mock = mocker.Mock()
+    exception_mock = mocker.Mock(status_code=404)
     exception_mock.json.return_value.get.return_value = "returned message"
     repo = mock_github3_login.return_value.repositories.return_value[1]
     repo.create_issue.side_effect = github3.exceptions.ClientError(exception_mock)
@@ -383,12 +426,11 @@ def test_link_issue_success(
     label3 = mocker.Mock()
     label3.name = "testing"
 
-    issue1 = mocker.Mock(title="issue title", number=3)
-    issue1.labels.return_value = []
-    issue2 = mocker.Mock(title="doesnt match title", number=4)
-    issue2.labels.return_value = [label1]
-    issue3 = mocker.Mock(title="match issue title", number=5)
-    issue3.labels.return_value = [label2, label3]
+    issue1 = mocker.Mock(title="issue title", number=3, original_labels=[])
+    issue2 = mocker.Mock(title="doesnt match title", number=4, original_labels=[label1])
+    issue3 = mocker.Mock(
+        title="match issue title", number=5, original_labels=[label2, label3]
+    )
 
     repo = mock_github3_login.return_value.repositories.return_value[1]
     repo.issues.return_value = [
@@ -396,11 +438,17 @@ def test_link_issue_success(
         issue2,
         issue3,
     ]
+    request_labels = domain_prs[1].labels
     gc.GithubService(domain_gh_conn_settings[0]).link_issues(
         "staticdev/omg", domain_prs[1]
     )
 
+    assert request_labels == {"testing", "refactor"}
+    repo.issues.assert_called_once_with(state="open")
+
     assert domain_prs[1].body == "my body\n\nCloses #3\nCloses #5\n"
+    issue1.labels.assert_not_called()
+    issue3.labels.assert_not_called()
     case = unittest.TestCase()
     case.assertCountEqual(domain_prs[1].labels, {"testing", "refactor", "enhancement"})
 
@@ -482,6 +530,9 @@ def test_merge_pull_request_from_repo_success(
     ).merge_pull_request_from_repo("staticdev/omg", domain_mpr)
 
     assert response == "staticdev/omg: PR merged successfully."
+    repo.pull_requests.assert_called_once_with(
+        base="branch", head="org name:main", number=2
+    )
 
 
 def test_merge_pull_request_from_repo_error_merging() -> None:
@@ -1,9 +1,12 @@
 """Test cases for the __main__ module."""
 import pytest
+import yaml
+from _pytest.tmpdir import Path
 from click.testing import CliRunner
 from pytest_mock import MockerFixture
 
 import git_portfolio.__main__
+import git_portfolio.config_manager as cm
 import git_portfolio.domain.config as c
 import git_portfolio.response_objects as res
 
@@ -142,6 +145,63 @@ def test_gitp_config_check_no_repos(
     assert result.output.startswith("Error: no config found")
 
 
+def test_max_concurrent(
+    mock_gh_create_issue_use_case: MockerFixture,
+    mock_github_service: MockerFixture,
+    mock_prompt_inquirer_prompter: MockerFixture,
+    mock_config_manager: MockerFixture,
+    runner: CliRunner,
+) -> None:
+    """It limits the number of concurrent requests."""
+    runner.invoke(
+        git_portfolio.__main__.main,
+        ["--max-concurrent", "4", "create", "issues"],
+        prog_name="gitp",
+    )
+
+    mock_gh_create_issue_use_case.assert_called_once_with(
+        mock_config_manager, mock_github_service.return_value, 4
+    )
+
+
+def test_max_concurrent_not_saved(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    mock_prompt_inquirer_prompter: MockerFixture,
+    mock_github_service: MockerFixture,
+    runner: CliRunner,
+) -> None:
+    """It does not save the number of concurrent requests in config."""
+    mocker.patch("os.path.expanduser", return_value=str(tmp_path))
+    config_manager = cm.ConfigManager()
+    config_manager.config = c.Config("", "mytoken", ["staticdev/omg"])
+    mocker.patch("git_portfolio.__main__.CONFIG_MANAGER", config_manager)
+    mock_prompt_inquirer_prompter.new_repos.return_value = True
+    mock_prompt_inquirer_prompter.select_repos.return_value = ["staticdev/omg2"]
+    runner.invoke(
+        git_portfolio.__main__.main,
+        ["--max-concurrent", "4", "config", "repos"],
+        prog_name="gitp",
+    )
+    saved = yaml.safe_load((tmp_path / ".gitp" / "config.yaml").read_text())
+
+    assert saved["github_selected_repos"] == ["staticdev/omg2"]
+    assert saved["max_workers"] == 0
+
+
+def test_max_concurrent_invalid(
+    mock_config_manager: MockerFixture, runner: CliRunner
+) -> None:
+    """It fails with a non positive number."""
+    result = runner.invoke(
+        git_portfolio.__main__.main,
+        ["--max-concurrent", "0", "status"],
+        prog_name="gitp",
+    )
+
+    assert result.exit_code == 2
+
+
 def test_add_success(
     mock_git_use_case: MockerFixture,
     mock_config_manager: MockerFixture,
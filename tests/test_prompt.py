@@ -60,6 +60,22 @@ def test_create_issues(mock_inquirer_prompt: MockerFixture) -> None:
     assert result == expected
 
 
+def test_create_issues_labels_with_spaces(mock_inquirer_prompt: MockerFixture) -> None:
+    """It returns issue with trimmed labels."""
+    mock_inquirer_prompt.return_value = {
+        "title": "my title",
+        "labels": " testing ,refactor,  good first issue ",
+        "body": "my body",
+        "correct": True,
+    }
+    result = p.InquirerPrompter.create_issues(["staticdev/omg"])
+    expected = i.Issue(
+        "my title", "my body", {"testing", "refactor", "good first issue"}
+    )
+
+    assert result == expected
+
+
 def test_create_issues_no_labels(mock_inquirer_prompt: MockerFixture) -> None:
     """It returns issue."""
     mock_inquirer_prompt.return_value = {
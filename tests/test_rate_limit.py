@@ -0,0 +1,229 @@
+"""Test cases for the rate limit module."""
+import threading
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+import pytest
+from pytest_mock import MockerFixture
+
+import git_portfolio.rate_limit as rl
+
+
+def _response(
+    mocker: MockerFixture,
+    status_code: int = 200,
+    text: str = "",
+    headers: Optional[Dict[str, str]] = None,
+) -> Any:
+    response = mocker.Mock(status_code=status_code, text=text)
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def mock_send(mocker: MockerFixture) -> MockerFixture:
+    """Fixture for mocking HTTPAdapter.send."""
+    return mocker.patch("requests.adapters.HTTPAdapter.send")
+
+
+@pytest.fixture
+def mock_sleep(mocker: MockerFixture) -> MockerFixture:
+    """Fixture for mocking time.sleep."""
+    return mocker.patch("time.sleep")
+
+
+@pytest.fixture
+def mock_time(mocker: MockerFixture) -> MockerFixture:
+    """Fixture for mocking time.time."""
+    mock = mocker.patch("time.time")
+    mock.return_value = 1000.0
+    return mock
+
+
+def _limits(remaining: int, reset: int) -> Dict[str, str]:
+    return {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+    }
+
+
+def test_send_without_limits(
+    mocker: MockerFixture, mock_send: MockerFixture, mock_sleep: MockerFixture
+) -> None:
+    """It returns the response without waiting."""
+    response = _response(mocker)
+    mock_send.return_value = response
+    adapter = rl.RateLimitAdapter()
+
+    assert adapter.send(mocker.Mock(path_url="/user")) is response
+    assert adapter.send(mocker.Mock(path_url="/user")) is response
+    mock_sleep.assert_not_called()
+
+
+def test_send_above_threshold(
+    mocker: MockerFixture,
+    mock_send: MockerFixture,
+    mock_sleep: MockerFixture,
+    mock_time: MockerFixture,
+) -> None:
+    """It does not wait while there are enough remaining requests."""
+    mock_send.return_value = _response(mocker, headers=_limits(100, 1060))
+    adapter = rl.RateLimitAdapter()
+    adapter.send(mocker.Mock(path_url="/user"))
+    adapter.send(mocker.Mock(path_url="/user"))
+
+    mock_sleep.assert_not_called()
+
+
+def test_send_below_threshold_waits_reset(
+    mocker: MockerFixture,
+    mock_send: MockerFixture,
+    mock_sleep: MockerFixture,
+    mock_time: MockerFixture,
+) -> None:
+    """It waits until rate limit reset before the next request."""
+    mock_echo = mocker.patch("click.echo")
+    mock_send.return_value = _response(mocker, headers=_limits(10, 1060))
+    adapter = rl.RateLimitAdapter()
+    adapter.send(mocker.Mock(path_url="/user"))
+    adapter.send(mocker.Mock(path_url="/user"))
+
+    mock_sleep.assert_called_once_with(60.0)
+    mock_echo.assert_called_once_with(
+        "GitHub rate limit almost reached, waiting 60s for it to reset.", err=True
+    )
+
+
+def test_send_below_threshold_notifies_once(
+    mocker: MockerFixture,
+    mock_send: MockerFixture,
+    mock_sleep: MockerFixture,
+    mock_time: MockerFixture,
+) -> None:
+    """It announces the wait once for all concurrent requests."""
+    mock_echo = mocker.patch("click.echo")
+    mock_send.return_value = _response(mocker, headers=_limits(10, 1060))
+    adapter = rl.RateLimitAdapter()
+    adapter.send(mocker.Mock(path_url="/user"))
+    threads = [
+        threading.Thread(target=adapter.send, args=(mocker.Mock(path_url="/user"),))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mock_sleep.call_count == 4
+    mock_echo.assert_called_once()
+
+
+def test_send_below_threshold_rounds_wait_up(
+    mocker: MockerFixture,
+    mock_send: MockerFixture,
+    mock_sleep: MockerFixture,
+    mock_time: MockerFixture,
+) -> None:
+    """It does not announce waits under a second as zero seconds."""
+    mock_echo = mocker.patch("click.echo")
+    mock_send.return_value = _response(mocker, headers=_limits(10, 1000))
+    mock_time.return_value = 999.6
+    adapter = rl.RateLimitAdapter()
+    adapter.send(mocker.Mock(path_url="/user"))
+    adapter.send(mocker.Mock(path_url="/user"))
+
+    mock_echo.assert_called_once_with(
+        "GitHub rate limit almost reached, waiting 1s for it to reset.", err=True
+    )
+
+
+def test_send_below_threshold_after_reset(
+    mocker: MockerFixture,
+    mock_send: MockerFixture,
+    mock_sleep: MockerFixture,
+    mock_time: MockerFixture,
+) -> None:
+    """It does not wait when the reset time has passed."""
+    mock_send.return_value = _response(mocker, headers=_limits(10, 900))
+    adapter = rl.RateLimitAdapter()
+    adapter.send(mocker.Mock(path_url="/user"))
+    adapter.send(mocker.Mock(path_url="/user"))
+
+    mock_sleep.assert_not_called()
+
+
+def test_send_secondary_rate_limit_backoff(
+    mocker: MockerFixture,
+    mock_send: MockerFixture,
+    mock_sleep: MockerFixture,
+) -> None:
+    """It retries with backoff after a secondary rate limit."""
+    limited = _response(
+        mocker, 403, "You have exceeded a secondary rate limit. Please wait."
+    )
+    success = _response(mocker)
+    mock_send.side_effect = [limited, success]
+    mocker.patch("random.uniform", return_value=0)
+
+    assert rl.RateLimitAdapter().send(mocker.Mock(path_url="/user")) is success
+    mock_sleep.assert_called_once_with(rl.BACKOFF_DELAYS[0])
+
+
+def test_send_secondary_rate_limit_retry_after(
+    mocker: MockerFixture,
+    mock_send: MockerFixture,
+    mock_sleep: MockerFixture,
+) -> None:
+    """It waits the time given by Retry-After header."""
+    limited = _response(
+        mocker, 403, "secondary rate limit", headers={"Retry-After": "30"}
+    )
+    success = _response(mocker)
+    mock_send.side_effect = [limited, success]
+
+    assert rl.RateLimitAdapter().send(mocker.Mock(path_url="/user")) is success
+    mock_sleep.assert_called_once_with(30.0)
+
+
+def test_send_secondary_rate_limit_gives_up(
+    mocker: MockerFixture,
+    mock_send: MockerFixture,
+    mock_sleep: MockerFixture,
+) -> None:
+    """It returns the last response when all retries are used."""
+    limited = _response(mocker, 403, "secondary rate limit")
+    mock_send.return_value = limited
+
+    assert rl.RateLimitAdapter().send(mocker.Mock(path_url="/user")) is limited
+    assert mock_send.call_count == len(rl.BACKOFF_DELAYS) + 1
+
+
+def test_send_forbidden(
+    mocker: MockerFixture,
+    mock_send: MockerFixture,
+    mock_sleep: MockerFixture,
+) -> None:
+    """It does not retry other forbidden responses."""
+    forbidden = _response(mocker, 403, "Resource not accessible by integration")
+    mock_send.return_value = forbidden
+
+    assert rl.RateLimitAdapter().send(mocker.Mock(path_url="/user")) is forbidden
+    mock_sleep.assert_not_called()
+
+
+def test_send_primary_rate_limit_waits_reset(
+    mocker: MockerFixture,
+    mock_send: MockerFixture,
+    mock_sleep: MockerFixture,
+    mock_time: MockerFixture,
+) -> None:
+    """It waits the rate limit reset and retries."""
+    limited = _response(
+        mocker, 403, "API rate limit exceeded", headers=_limits(0, 1060)
+    )
+    success = _response(mocker, headers=_limits(4999, 4600))
+    mock_send.side_effect = [limited, success]
+
+    assert rl.RateLimitAdapter().send(mocker.Mock(path_url="/user")) is success
+    mock_sleep.assert_called_once_with(60.0)
@@ -21,3 +21,17 @@ def test_execute(mock_config_manager: MockerFixture) -> None:
 
     assert bool(response) is True
     assert "gitp repositories successfully configured." == response.value
+
+
+def test_execute_duplicated_repos(mock_config_manager: MockerFixture) -> None:
+    """It saves selected repos without duplicates."""
+    config_manager = mock_config_manager.return_value
+    config_manager.config = c.Config("", "abc", [])
+    cr.ConfigReposUseCase(config_manager).execute(
+        ["staticdev/omg", "staticdev/omg2", "staticdev/omg"]
+    )
+
+    assert config_manager.config.github_selected_repos == [
+        "staticdev/omg",
+        "staticdev/omg2",
+    ]
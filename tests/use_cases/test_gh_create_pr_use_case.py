@@ -119,3 +119,18 @@ def test_execute_link_issue_for_specific_repo(
 
     assert bool(response) is True
     assert "success message\n" == response.value
+
+
+def test_execute_link_issue_does_not_change_request(
+    mock_config_manager: MockerFixture,
+    mock_github_service: MockerFixture,
+    domain_prs: List[pr.PullRequest],
+) -> None:
+    """It links issues on a copy of the request for each repo."""
+    config_manager = mock_config_manager.return_value
+    github_service = mock_github_service.return_value
+    github_service.link_issues.side_effect = lambda repo, pr: setattr(pr, "body", repo)
+    request = domain_prs[1]
+    ghcp.GhCreatePrUseCase(config_manager, github_service).execute(request)
+
+    assert request.body == "my body"
@@ -0,0 +1,106 @@
+"""Test cases for the base Github use case."""
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+import git_portfolio.domain.config as c
+import git_portfolio.use_cases.gh_use_case as ghu
+
+
+@pytest.fixture
+def mock_config_manager(mocker: MockerFixture) -> MockerFixture:
+    """Fixture for mocking CONFIG_MANAGER."""
+    mock = mocker.patch("git_portfolio.config_manager.ConfigManager", autospec=True)
+    mock.return_value.config = c.Config(
+        "", "mytoken", ["staticdev/omg", "staticdev/omg2", "staticdev/omg3"]
+    )
+    return mock
+
+
+@pytest.fixture
+def mock_github_service(mocker: MockerFixture) -> MockerFixture:
+    """Fixture for mocking GithubService."""
+    return mocker.patch("git_portfolio.github_service.GithubService", autospec=True)
+
+
+@pytest.fixture
+def mock_thread_pool_executor(mocker: MockerFixture) -> MockerFixture:
+    """Fixture for mocking ThreadPoolExecutor."""
+    return mocker.patch(
+        "git_portfolio.use_cases.gh_use_case.ThreadPoolExecutor", autospec=True
+    )
+
+
+def test_call_for_all_repos_keeps_order(
+    mock_config_manager: MockerFixture, mock_github_service: MockerFixture
+) -> None:
+    """It concatenates outputs in the selected repos order."""
+    use_case = ghu.GhUseCase(
+        mock_config_manager.return_value, mock_github_service.return_value
+    )
+    output = use_case.call_for_all_repos(lambda repo: f"{repo}\n")
+
+    assert output == "staticdev/omg\nstaticdev/omg2\nstaticdev/omg3\n"
+
+
+def test_call_for_all_repos_default_max_workers(
+    mock_config_manager: MockerFixture,
+    mock_github_service: MockerFixture,
+    mock_thread_pool_executor: MockerFixture,
+) -> None:
+    """It uses default number of workers."""
+    use_case = ghu.GhUseCase(
+        mock_config_manager.return_value, mock_github_service.return_value
+    )
+    use_case.call_for_all_repos(lambda repo: "")
+
+    mock_thread_pool_executor.assert_called_once_with(
+        max_workers=ghu.DEFAULT_MAX_WORKERS
+    )
+
+
+def test_call_for_all_repos_configured_max_workers(
+    mock_config_manager: MockerFixture,
+    mock_github_service: MockerFixture,
+    mock_thread_pool_executor: MockerFixture,
+) -> None:
+    """It uses number of workers from config."""
+    config_manager = mock_config_manager.return_value
+    config_manager.config.max_workers = 3
+    use_case = ghu.GhUseCase(config_manager, mock_github_service.return_value)
+    use_case.call_for_all_repos(lambda repo: "")
+
+    mock_thread_pool_executor.assert_called_once_with(max_workers=3)
+
+
+@pytest.mark.parametrize("max_workers", [-1, "4", None, True])
+def test_call_for_all_repos_invalid_configured_max_workers(
+    mock_config_manager: MockerFixture,
+    mock_github_service: MockerFixture,
+    mock_thread_pool_executor: MockerFixture,
+    max_workers: Any,
+) -> None:
+    """It uses default number of workers when config value is invalid."""
+    config_manager = mock_config_manager.return_value
+    config_manager.config.max_workers = max_workers
+    use_case = ghu.GhUseCase(config_manager, mock_github_service.return_value)
+    use_case.call_for_all_repos(lambda repo: "")
+
+    mock_thread_pool_executor.assert_called_once_with(
+        max_workers=ghu.DEFAULT_MAX_WORKERS
+    )
+
+
+def test_call_for_all_repos_max_workers_override(
+    mock_config_manager: MockerFixture,
+    mock_github_service: MockerFixture,
+    mock_thread_pool_executor: MockerFixture,
+) -> None:
+    """It prefers the number of workers given to the use case."""
+    config_manager = mock_config_manager.return_value
+    config_manager.config.max_workers = 3
+    use_case = ghu.GhUseCase(config_manager, mock_github_service.return_value, 5)
+    use_case.call_for_all_repos(lambda repo: "")
+
+    mock_thread_pool_executor.assert_called_once_with(max_workers=5)